@@ -3,10 +3,187 @@
 import { defineEventHandler, setResponseStatus } from 'h3';
 import type { H3Event } from 'h3';
 import { createClient } from '@supabase/supabase-js';
+import type { SupabaseClient } from '@supabase/supabase-js';
 
 // Generate trace ID for debugging
 function generateTraceId(): string {
-    return `trace_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    return `trace_${Date.now()}_${Math.random().toString(36).slice(2, 11)}`;
+}
+
+// One client per warm serverless instance, so consecutive requests skip the
+// createClient/GoTrueClient setup (connection pooling is already handled by
+// the runtime's global fetch dispatcher either way)
+let cachedClient: { url: string; key: string; client: SupabaseClient } | null = null;
+
+function getSupabaseClient(url: string, key: string): SupabaseClient {
+    if (!cachedClient || cachedClient.url !== url || cachedClient.key !== key) {
+        cachedClient = {
+            url,
+            key,
+            // Service-role server client: no user session to store or refresh
+            client: createClient(url, key, {
+                auth: { persistSession: false, autoRefreshToken: false }
+            })
+        };
+    }
+    return cachedClient.client;
+}
+
+// Max ids per `.in()` filter - keeps the PostgREST GET URL well under length limits
+const IN_FILTER_CHUNK = 500;
+
+// Fetch rows whose `column` is in `ids`, one request per chunk instead of
+// pulling the whole table just to join a handful of rows in memory
+async function fetchByIds(supabase: any, table: string, columns: string, column: string, ids: any[]): Promise<any[]> {
+    // A null id would reach PostgREST as a literal `null` in `in.(...)` and
+    // fail the cast; leave those rows to the callers' missing-row fallbacks
+    const uniqueIds = [...new Set(ids.filter(id => id != null))];
+    const rows: any[] = [];
+    for (let i = 0; i < uniqueIds.length; i += IN_FILTER_CHUNK) {
+        const { data, error } = await supabase
+            .from(table)
+            .select(columns)
+            .in(column, uniqueIds.slice(i, i + IN_FILTER_CHUNK));
+
+        if (error) throw error;
+        rows.push(...(data || []));
+    }
+    return rows;
+}
+
+// Matches PostgREST's default max-rows; a plain select silently stops here
+const PAGE_SIZE = 1000;
+
+// Pages requested at once after the first page comes back full
+const PAGE_CONCURRENCY = 4;
+
+// Read every row of an ordered query page by page with `.range()`.
+// `buildQuery` must return a fresh builder since each one is single-use.
+// The first page is fetched alone so small tables cost one request; past
+// that, pages go out in concurrent waves until one comes back short
+async function fetchAllPages(buildQuery: () => any): Promise<any[]> {
+    const fetchPage = async (page: number): Promise<any[]> => {
+        const from = page * PAGE_SIZE;
+        const { data, error } = await buildQuery().range(from, from + PAGE_SIZE - 1);
+
+        // A speculative page past the end may be reported as an unsatisfiable range
+        if (error?.code === 'PGRST103') return [];
+        if (error) throw error;
+        return data || [];
+    };
+
+    let lastPage = await fetchPage(0);
+    const rows = [...lastPage];
+    for (let page = 1; lastPage.length === PAGE_SIZE; page += PAGE_CONCURRENCY) {
+        const wave = await Promise.all(
+            Array.from({ length: PAGE_CONCURRENCY }, (_, i) => fetchPage(page + i))
+        );
+        for (const data of wave) {
+            rows.push(...data);
+            lastPage = data;
+            if (data.length < PAGE_SIZE) break;
+        }
+    }
+    return rows;
+}
+
+// STEP 3: Firms with estimated return
+async function fetchFirms(supabase: any): Promise<any[]> {
+    // Fixed query: Use RPC or fetch separately instead of ordering by nested field
+    const [firmsRaw, predictions] = await Promise.all([
+        fetchAllPages(() => supabase
+            .from('firmalar')
+            .select('id, ad, ciro')
+            .order('id', { ascending: true })),
+        // Fetch predictions separately
+        fetchAllPages(() => supabase
+            .from('firma_tahminleme')
+            .select('firma_id, tahmini_getiri')
+            .not('tahmini_getiri', 'is', null)
+            .order('tahmini_getiri', { ascending: false })
+            .order('firma_id', { ascending: true }))
+    ]);
+
+    // Join in memory
+    const firmMap = new Map(firmsRaw.map(f => [f.id, f]));
+    return predictions
+        .map(p => {
+            const firm = firmMap.get(p.firma_id);
+            return firm ? {
+                id: firm.id,
+                ad: firm.ad,
+                ciro: firm.ciro,
+                tahmini_getiri: p.tahmini_getiri
+            } : null;
+        })
+        .filter(Boolean);
+}
+
+// STEP 4a: Top 7 Sustainability Scores
+async function fetchSustainability(supabase: any): Promise<any[]> {
+    const { data: sustScores, error: sustScoresError } = await supabase
+        .from('firma_tahminleme')
+        .select('firma_id, surdurulebilirlik_uyum_puani')
+        .not('surdurulebilirlik_uyum_puani', 'is', null)
+        .order('surdurulebilirlik_uyum_puani', { ascending: false })
+        .limit(7);
+
+    if (sustScoresError) throw sustScoresError;
+
+    const sustRaw = await fetchByIds(
+        supabase, 'firmalar', 'id, ad', 'id',
+        (sustScores || []).map(s => s.firma_id)
+    );
+
+    const sustMap = new Map(sustRaw.map(f => [f.id, f.ad]));
+    return (sustScores || []).map(s => ({
+        ad: sustMap.get(s.firma_id) || 'Unknown',
+        surdurulebilirlik_uyum_puani: s.surdurulebilirlik_uyum_puani
+    }));
+}
+
+// STEP 4b: Top 10 Recycling Rates
+async function fetchRecycling(supabase: any): Promise<any[]> {
+    const { data: recyclingData, error: recyclingError } = await supabase
+        .from('firmalar')
+        .select('ad, geri_donusum_orani')
+        .not('geri_donusum_orani', 'is', null)
+        .order('geri_donusum_orani', { ascending: false })
+        .limit(10);
+
+    if (recyclingError) throw recyclingError;
+
+    return recyclingData || [];
+}
+
+// STEP 4c: Top 10 Entrepreneur Compatibility
+async function fetchEntrepreneur(supabase: any): Promise<any[]> {
+    const { data: entrScores, error: entrScoresError } = await supabase
+        .from('girisimci_tahminleme')
+        .select('girisimci_id, kriter_uyumluluk_puani')
+        .not('kriter_uyumluluk_puani', 'is', null)
+        .order('kriter_uyumluluk_puani', { ascending: false })
+        .limit(10);
+
+    if (entrScoresError) throw entrScoresError;
+
+    const entrRaw = await fetchByIds(
+        supabase, 'girisimciler',
+        'id, isletme_adi, kadin_calisan_orani, engelli_calisan_orani, kurulus_yili',
+        'id', (entrScores || []).map(s => s.girisimci_id)
+    );
+
+    const entrMap = new Map(entrRaw.map(e => [e.id, e]));
+    return (entrScores || []).map(s => {
+        const entr = entrMap.get(s.girisimci_id);
+        return entr ? {
+            isletme_adi: entr.isletme_adi,
+            kriter_uyumluluk_puani: s.kriter_uyumluluk_puani,
+            kadin_calisan_orani: entr.kadin_calisan_orani,
+            engelli_calisan_orani: entr.engelli_calisan_orani,
+            kurulus_yili: entr.kurulus_yili
+        } : null;
+    }).filter(Boolean);
 }
 
 export default defineEventHandler(async (event: H3Event) => {
@@ -38,7 +215,7 @@ export default defineEventHandler(async (event: H3Event) => {
         // ========================================
         let supabase;
         try {
-            supabase = createClient(supabaseUrl, supabaseKey);
+            supabase = getSupabaseClient(supabaseUrl, supabaseKey);
         } catch (error: any) {
             console.error(`[${traceId}] Step 2 failed - Supabase client init:`, error);
             setResponseStatus(event, 503);
@@ -52,42 +229,19 @@ export default defineEventHandler(async (event: H3Event) => {
         }
 
         // ========================================
-        // STEP 3: FETCH FIRMS WITH ESTIMATED RETURN
+        // STEP 3 + 4: FETCH FIRMS AND CHART DATASETS
         // ========================================
-        let firms;
-        try {
-            // Fixed query: Use RPC or fetch separately instead of ordering by nested field
-            const { data: firmsRaw, error: firmsError } = await supabase
-                .from('firmalar')
-                .select('id, ad, ciro')
-                .order('id', { ascending: true });
-
-            if (firmsError) throw firmsError;
-
-            // Fetch predictions separately
-            const { data: predictions, error: predError } = await supabase
-                .from('firma_tahminleme')
-                .select('firma_id, tahmini_getiri')
-                .not('tahmini_getiri', 'is', null)
-                .order('tahmini_getiri', { ascending: false });
-
-            if (predError) throw predError;
-
-            // Join in memory
-            const firmMap = new Map(firmsRaw.map(f => [f.id, f]));
-            firms = (predictions || [])
-                .map(p => {
-                    const firm = firmMap.get(p.firma_id);
-                    return firm ? {
-                        id: firm.id,
-                        ad: firm.ad,
-                        ciro: firm.ciro,
-                        tahmini_getiri: p.tahmini_getiri
-                    } : null;
-                })
-                .filter(Boolean);
-
-        } catch (error: any) {
+        // The four queries are independent, so issue them together and
+        // report failures afterwards in the original step order
+        const [firmsResult, sustResult, recyclingResult, entrResult] = await Promise.allSettled([
+            fetchFirms(supabase),
+            fetchSustainability(supabase),
+            fetchRecycling(supabase),
+            fetchEntrepreneur(supabase)
+        ]);
+
+        if (firmsResult.status === 'rejected') {
+            const error = firmsResult.reason;
             console.error(`[${traceId}] Step 3 failed - Firms query:`, error);
             setResponseStatus(event, 502);
             return {
@@ -99,36 +253,8 @@ export default defineEventHandler(async (event: H3Event) => {
             };
         }
 
-        // ========================================
-        // STEP 4: FETCH CHART DATASETS
-        // ========================================
-        let sustainability, recycling, entrepreneur;
-
-        try {
-            // 4a: Top 7 Sustainability Scores
-            const { data: sustRaw, error: sustError } = await supabase
-                .from('firmalar')
-                .select('id, ad')
-                .order('id', { ascending: true });
-
-            if (sustError) throw sustError;
-
-            const { data: sustScores, error: sustScoresError } = await supabase
-                .from('firma_tahminleme')
-                .select('firma_id, surdurulebilirlik_uyum_puani')
-                .not('surdurulebilirlik_uyum_puani', 'is', null)
-                .order('surdurulebilirlik_uyum_puani', { ascending: false })
-                .limit(7);
-
-            if (sustScoresError) throw sustScoresError;
-
-            const sustMap = new Map(sustRaw.map(f => [f.id, f.ad]));
-            sustainability = (sustScores || []).map(s => ({
-                ad: sustMap.get(s.firma_id) || 'Unknown',
-                surdurulebilirlik_uyum_puani: s.surdurulebilirlik_uyum_puani
-            }));
-
-        } catch (error: any) {
+        if (sustResult.status === 'rejected') {
+            const error = sustResult.reason;
             console.error(`[${traceId}] Step 4a failed - Sustainability query:`, error);
             setResponseStatus(event, 502);
             return {
@@ -140,20 +266,8 @@ export default defineEventHandler(async (event: H3Event) => {
             };
         }
 
-        try {
-            // 4b: Top 10 Recycling Rates
-            const { data: recyclingData, error: recyclingError } = await supabase
-                .from('firmalar')
-                .select('ad, geri_donusum_orani')
-                .not('geri_donusum_orani', 'is', null)
-                .order('geri_donusum_orani', { ascending: false })
-                .limit(10);
-
-            if (recyclingError) throw recyclingError;
-
-            recycling = recyclingData || [];
-
-        } catch (error: any) {
+        if (recyclingResult.status === 'rejected') {
+            const error = recyclingResult.reason;
             console.error(`[${traceId}] Step 4b failed - Recycling query:`, error);
             setResponseStatus(event, 502);
             return {
@@ -165,37 +279,8 @@ export default defineEventHandler(async (event: H3Event) => {
             };
         }
 
-        try {
-            // 4c: Top 10 Entrepreneur Compatibility
-            const { data: entrRaw, error: entrError } = await supabase
-                .from('girisimciler')
-                .select('id, isletme_adi, kadin_calisan_orani, engelli_calisan_orani, kurulus_yili')
-                .order('id', { ascending: true });
-
-            if (entrError) throw entrError;
-
-            const { data: entrScores, error: entrScoresError } = await supabase
-                .from('girisimci_tahminleme')
-                .select('girisimci_id, kriter_uyumluluk_puani')
-                .not('kriter_uyumluluk_puani', 'is', null)
-                .order('kriter_uyumluluk_puani', { ascending: false })
-                .limit(10);
-
-            if (entrScoresError) throw entrScoresError;
-
-            const entrMap = new Map(entrRaw.map(e => [e.id, e]));
-            entrepreneur = (entrScores || []).map(s => {
-                const entr = entrMap.get(s.girisimci_id);
-                return entr ? {
-                    isletme_adi: entr.isletme_adi,
-                    kriter_uyumluluk_puani: s.kriter_uyumluluk_puani,
-                    kadin_calisan_orani: entr.kadin_calisan_orani,
-                    engelli_calisan_orani: entr.engelli_calisan_orani,
-                    kurulus_yili: entr.kurulus_yili
-                } : null;
-            }).filter(Boolean);
-
-        } catch (error: any) {
+        if (entrResult.status === 'rejected') {
+            const error = entrResult.reason;
             console.error(`[${traceId}] Step 4c failed - Entrepreneur query:`, error);
             setResponseStatus(event, 502);
             return {
@@ -207,6 +292,11 @@ export default defineEventHandler(async (event: H3Event) => {
             };
         }
 
+        const firms = firmsResult.value;
+        const sustainability = sustResult.value;
+        const recycling = recyclingResult.value;
+        const entrepreneur = entrResult.value;
+
         // ========================================
         // STEP 5: COMPUTE DEFAULT PARAMETERS
         // ========================================